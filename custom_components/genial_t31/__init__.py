@@ -8,11 +8,24 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, DEFAULT_DEVICE_NAME
+from .const import (
+    DOMAIN,
+    DEFAULT_DEVICE_NAME,
+    CONF_FEVER_THRESHOLD,
+    CONF_HIGH_FEVER_THRESHOLD,
+    CONF_ALERT_HYSTERESIS,
+    CONF_ALERT_MIN_DURATION,
+    CONF_SESSION_TIMEOUT,
+    DEFAULT_FEVER_THRESHOLD,
+    DEFAULT_HIGH_FEVER_THRESHOLD,
+    DEFAULT_ALERT_HYSTERESIS,
+    DEFAULT_ALERT_MIN_DURATION,
+    DEFAULT_SESSION_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Genial T31 integration from YAML."""
@@ -35,7 +48,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     client = GenialT31Client(
         hass=hass,  # Добавлено для работы с Bluetooth proxy
         mac_address=entry.data["mac_address"],
-        name=entry.data.get("name", DEFAULT_DEVICE_NAME)
+        name=entry.data.get("name", DEFAULT_DEVICE_NAME),
+        fever_threshold=entry.options.get(
+            CONF_FEVER_THRESHOLD, DEFAULT_FEVER_THRESHOLD
+        ),
+        high_fever_threshold=entry.options.get(
+            CONF_HIGH_FEVER_THRESHOLD, DEFAULT_HIGH_FEVER_THRESHOLD
+        ),
+        alert_hysteresis=entry.options.get(
+            CONF_ALERT_HYSTERESIS, DEFAULT_ALERT_HYSTERESIS
+        ),
+        alert_min_duration=entry.options.get(
+            CONF_ALERT_MIN_DURATION, DEFAULT_ALERT_MIN_DURATION
+        ),
+        session_timeout=entry.options.get(
+            CONF_SESSION_TIMEOUT, DEFAULT_SESSION_TIMEOUT
+        ),
     )
     
     # Create coordinator
@@ -55,6 +83,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register data callback
     client.set_data_callback(update_callback)
     
+    # Перезагружаем запись при изменении параметров
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -76,3 +107,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await coordinator.client.disconnect()
     
     return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload config entry when options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,72 @@
+"""Threshold alert engine for Genial T31 readings."""
+from typing import Dict, List, Optional, Tuple
+
+
+class AlertEngine:
+    """Evaluate temperature alerts directly on decoded readings.
+
+    Each alert turns on once the temperature stays at or above its threshold
+    for min_duration seconds, and turns off once it stays below
+    threshold - hysteresis for the same time. A gap between readings longer
+    than max_gap seconds restarts unconfirmed crossings.
+    """
+
+    def __init__(
+        self,
+        thresholds: Dict[str, float],
+        hysteresis: float,
+        min_duration: float,
+        max_gap: float,
+    ) -> None:
+        """Initialize the engine with thresholds keyed by alert name."""
+        self.thresholds = thresholds
+        self._hysteresis = hysteresis
+        self._min_duration = min_duration
+        self._max_gap = max_gap
+        self._active: Dict[str, bool] = {alert: False for alert in thresholds}
+        self._pending_since: Dict[str, Optional[float]] = {
+            alert: None for alert in thresholds
+        }
+        self._last_reading: Optional[float] = None
+
+    def reset_pending(self) -> None:
+        """Forget crossings that are not confirmed yet."""
+        for alert in self._pending_since:
+            self._pending_since[alert] = None
+        self._last_reading = None
+
+    def process(self, temperature: float, now: float) -> List[Tuple[str, bool]]:
+        """Process a reading and return the (alert, active) transitions."""
+        # Пропуск в данных не подтверждает пересечение
+        if (
+            self._last_reading is not None
+            and now - self._last_reading > self._max_gap
+        ):
+            self.reset_pending()
+        self._last_reading = now
+
+        transitions = []
+        for alert, threshold in self.thresholds.items():
+            active = self._active[alert]
+            if active:
+                crossed = temperature < threshold - self._hysteresis
+            else:
+                crossed = temperature >= threshold
+
+            if not crossed:
+                self._pending_since[alert] = None
+                continue
+
+            # Пересечение должно продержаться не меньше min_duration
+            pending_since = self._pending_since[alert]
+            if pending_since is None:
+                pending_since = self._pending_since[alert] = now
+            if now - pending_since >= self._min_duration:
+                self._active[alert] = not active
+                self._pending_since[alert] = None
+                transitions.append((alert, not active))
+        return transitions
+
+    def is_active(self, alert: str) -> bool:
+        """Return True if the alert is currently active."""
+        return self._active.get(alert, False)
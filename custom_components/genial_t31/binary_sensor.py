@@ -0,0 +1,99 @@
+"""Binary sensor platform for Genial T31."""
+import logging
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, DEFAULT_DEVICE_NAME, ALERT_FEVER, ALERT_HIGH_FEVER
+from .coordinator import GenialT31Coordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+BINARY_SENSOR_TYPES = {
+    ALERT_FEVER: {
+        "icon": "mdi:thermometer-alert",
+        "device_class": "problem",
+    },
+    ALERT_HIGH_FEVER: {
+        "icon": "mdi:thermometer-alert",
+        "device_class": "problem",
+    },
+}
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Genial T31 binary sensors from a config entry."""
+    coordinator: GenialT31Coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        GenialT31AlertSensor(coordinator, entry, alert)
+        for alert in BINARY_SENSOR_TYPES
+    )
+
+
+class GenialT31AlertSensor(CoordinatorEntity, BinarySensorEntity):
+    """Alert binary sensor driven directly by the BLE client."""
+
+    def __init__(
+        self,
+        coordinator: GenialT31Coordinator,
+        entry: ConfigEntry,
+        alert: str,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._alert = alert
+        self._config = BINARY_SENSOR_TYPES[alert]
+
+        self._attr_has_entity_name = True
+        self._attr_translation_key = alert
+        self._attr_unique_id = f"{entry.unique_id}_{alert}"
+        self._attr_device_class = self._config["device_class"]
+        self._attr_icon = self._config["icon"]
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.unique_id)},
+            name=entry.data.get("name", DEFAULT_DEVICE_NAME),
+            manufacturer="Genial",
+            model="T31",
+            sw_version="1.0",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to alert transitions."""
+        await super().async_added_to_hass()
+        # Состояние пишем сразу, минуя обновление координатора
+        self.async_on_remove(
+            self.coordinator.client.add_alert_listener(self._handle_alert)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        # Берем статус у клиента, чтобы не ждать обновления координатора
+        return self.coordinator.client.connected
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the alert is active."""
+        return self.coordinator.client.alert_active(self._alert)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional state attributes."""
+        return {
+            "threshold": self.coordinator.client.alert_threshold(self._alert),
+        }
+
+    @callback
+    def _handle_alert(self, alert: str, active: bool) -> None:
+        """Handle an alert transition from the BLE client."""
+        if alert == self._alert:
+            self.async_write_ha_state()
@@ -1,8 +1,8 @@
 """BLE client for Genial T31."""
-import asyncio
 import logging
-from typing import Optional, Callable
-from datetime import datetime, timedelta
+import time
+from typing import Optional, Callable, List
+from datetime import datetime, timedelta, timezone
 
 from bleak import BleakClient, BleakError
 from bleak_retry_connector import establish_connection
@@ -16,30 +16,74 @@ from homeassistant.components.bluetooth import (
 
 from .const import (
     LOGGER,
-    SERVICE_UUID,
-    CHAR_TX_UUID,
-    CHAR_RX_UUID,
-    INIT_PACKETS,
     DATA_TIMEOUT,
+    DEFAULT_FEVER_THRESHOLD,
+    DEFAULT_HIGH_FEVER_THRESHOLD,
+    DEFAULT_ALERT_HYSTERESIS,
+    DEFAULT_ALERT_MIN_DURATION,
+    DEFAULT_SESSION_TIMEOUT,
+    RATE_WINDOW,
+    EVENT_ALERT,
+    ALERT_FEVER,
+    ALERT_HIGH_FEVER,
+)
+from .alerts import AlertEngine
+from .derived import DerivedTemperature
+from .t31ble import (
+    BatteryReading,
+    BleakTransport,
+    TemperatureReading,
+    decode_packet,
+    start_measurement,
 )
 
 class GenialT31Client:
     """BLE client for Genial T31 thermometer."""
     
-    def __init__(self, hass, mac_address: str, name: str) -> None:
+    def __init__(
+        self,
+        hass,
+        mac_address: str,
+        name: str,
+        fever_threshold: float = DEFAULT_FEVER_THRESHOLD,
+        high_fever_threshold: float = DEFAULT_HIGH_FEVER_THRESHOLD,
+        alert_hysteresis: float = DEFAULT_ALERT_HYSTERESIS,
+        alert_min_duration: float = DEFAULT_ALERT_MIN_DURATION,
+        session_timeout: float = DEFAULT_SESSION_TIMEOUT,
+    ) -> None:
         """Initialize the client."""
         self.hass = hass
         self.mac_address = mac_address
         self.name = name
         self.client: Optional[BleakClient] = None
+        self._transport: Optional[BleakTransport] = None
         self._connected = False
         self._temperature: Optional[float] = None
         self._battery: Optional[int] = None
         self._last_data_received: Optional[datetime] = None
         self._last_update: Optional[datetime] = None
+        # Время (UTC) последнего разобранного значения каждого типа
+        self._temperature_updated: Optional[datetime] = None
+        self._battery_updated: Optional[datetime] = None
         self._data_callback: Optional[Callable[[], None]] = None
         self._notification_enabled = False
         self._scanner = None
+        self._derived = DerivedTemperature(
+            fever_threshold,
+            RATE_WINDOW.total_seconds(),
+            session_timeout * 60.0,
+            DATA_TIMEOUT.total_seconds(),
+        )
+        self._alerts = AlertEngine(
+            {
+                ALERT_FEVER: fever_threshold,
+                ALERT_HIGH_FEVER: high_fever_threshold,
+            },
+            alert_hysteresis,
+            alert_min_duration,
+            DATA_TIMEOUT.total_seconds(),
+        )
+        self._alert_listeners: List[Callable[[str, bool], None]] = []
         
     async def connect(self) -> bool:
         """Connect to the device using Bluetooth proxy."""
@@ -69,15 +113,14 @@ class GenialT31Client:
             
             LOGGER.info("✅ Соединение установлено через Bluetooth proxy")
             
-            # Включаем уведомления
-            await self.client.start_notify(CHAR_RX_UUID, self._notification_handler)
-            self._notification_enabled = True
-            
-            # Ждем немного перед отправкой пакетов
-            await asyncio.sleep(0.5)
+            # Неподтвержденные пересечения порогов не переносим через разрыв
+            self._alerts.reset_pending()
             
-            # Отправляем пакеты инициализации
-            await self._send_init_packets()
+            # Включаем уведомления и отправляем пакеты инициализации
+            self._transport = BleakTransport(self.client)
+            LOGGER.debug("Отправка пакетов инициализации")
+            await start_measurement(self._transport, self._notification_handler)
+            self._notification_enabled = True
             
             self._connected = True
             self._last_data_received = datetime.now()
@@ -129,52 +172,30 @@ class GenialT31Client:
             LOGGER.error("Ошибка получения устройства через Bluetooth proxy: %s", err)
             return None
     
-    async def _send_init_packets(self) -> None:
-        """Send initialization packets."""
-        if not self.client or not self.client.is_connected:
-            return
-        
-        try:
-            LOGGER.debug("Отправка пакетов инициализации")
-            
-            for i, packet in enumerate(INIT_PACKETS, 1):
-                try:
-                    await self.client.write_gatt_char(CHAR_TX_UUID, packet)
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    LOGGER.error("Ошибка отправки пакета %d: %s", i, e)
-            
-        except Exception as err:
-            LOGGER.error("Ошибка отправки пакетов: %s", err)
-    
-    def _notification_handler(self, sender: str, data: bytearray) -> None:
+    def _notification_handler(self, data: bytearray) -> None:
         """Handle incoming notifications."""
         try:
             # Обновляем время последних данных
             self._last_data_received = datetime.now()
             
             # Обработка данных
-            if len(data) == 13:
-                # Пакет с температурой
-                temp_raw = (data[3] << 8) | data[4]
-                temperature = temp_raw / 100.0
+            reading = decode_packet(data)
+            if isinstance(reading, TemperatureReading):
+                temperature = reading.temperature
+                self._temperature = temperature
+                self._temperature_updated = datetime.now(timezone.utc)
+                now = time.monotonic()
+                self._derived.add(temperature, now)
                 
-                if 20.0 <= temperature <= 45.0:
-                    self._temperature = temperature
+                # Оповещения проверяем прямо здесь, до координатора
+                for alert, active in self._alerts.process(temperature, now):
+                    self.hass.loop.call_soon_threadsafe(
+                        self._dispatch_alert, alert, active, temperature
+                    )
                 
-            elif len(data) == 9:
-                # Пакет с батареей
-                if len(data) >= 7:
-                    charge_raw = (data[5] << 8) | data[6]
-                    battery_voltage = charge_raw / 100.0
-                    
-                    # Расчет процента батареи
-                    min_voltage = 2.0
-                    max_voltage = 2.45
-                    battery_percent = (battery_voltage - min_voltage) / (max_voltage - min_voltage) * 100.0
-                    battery_percent = max(0, min(100, battery_percent))
-                    
-                    self._battery = int(battery_percent)
+            elif isinstance(reading, BatteryReading):
+                self._battery = reading.percent
+                self._battery_updated = datetime.now(timezone.utc)
             
             self._last_update = datetime.now()
             
@@ -185,9 +206,29 @@ class GenialT31Client:
         except Exception as err:
             LOGGER.error("Ошибка обработки уведомления: %s", err)
     
+    def _dispatch_alert(self, alert: str, active: bool, temperature: float) -> None:
+        """Fire an alert event and notify listeners (runs in the event loop)."""
+        LOGGER.info(
+            "Оповещение %s: %s (%.2f °C)", alert, "on" if active else "off", temperature
+        )
+        self.hass.bus.async_fire(
+            EVENT_ALERT,
+            {
+                "name": self.name,
+                "mac_address": self.mac_address,
+                "alert": alert,
+                "active": active,
+                "temperature": temperature,
+                "threshold": self._alerts.thresholds[alert],
+            },
+        )
+        for listener in list(self._alert_listeners):
+            listener(alert, active)
+    
     def _handle_disconnect(self, client: BleakClient) -> None:
         """Handle disconnect event."""
         LOGGER.warning("Устройство отключилось")
+        self._alerts.reset_pending()
         self._connected = False
         self._notification_enabled = False
         
@@ -195,8 +236,8 @@ class GenialT31Client:
         """Disconnect from the device."""
         if self.client:
             try:
-                if self._notification_enabled and self.client.is_connected:
-                    await self.client.stop_notify(CHAR_RX_UUID)
+                if self._notification_enabled and self._transport and self.client.is_connected:
+                    await self._transport.stop_notify()
                 
                 if self.client.is_connected:
                     await self.client.disconnect()
@@ -206,6 +247,7 @@ class GenialT31Client:
             finally:
                 self._connected = False
                 self._notification_enabled = False
+                self._transport = None
                 self.client = None
     
     def check_data_timeout(self) -> bool:
@@ -220,6 +262,25 @@ class GenialT31Client:
         """Set callback for data updates."""
         self._data_callback = callback
         
+    def add_alert_listener(
+        self, listener: Callable[[str, bool], None]
+    ) -> Callable[[], None]:
+        """Add a listener for alert transitions and return its remover."""
+        self._alert_listeners.append(listener)
+        
+        def remove_listener() -> None:
+            self._alert_listeners.remove(listener)
+        
+        return remove_listener
+        
+    def alert_active(self, alert: str) -> bool:
+        """Return True if the alert is currently active."""
+        return self._alerts.is_active(alert)
+        
+    def alert_threshold(self, alert: str) -> float:
+        """Return the threshold of the alert."""
+        return self._alerts.thresholds[alert]
+        
     @property
     def connected(self) -> bool:
         """Return connection status."""
@@ -238,6 +299,33 @@ class GenialT31Client:
         """Return current battery level."""
         return self._battery
         
+    @property
+    def temperature_rate(self) -> Optional[float]:
+        """Return temperature rate of change in °C/min."""
+        return self._derived.rate
+        
+    @property
+    def temperature_max(self) -> Optional[float]:
+        """Return session maximum temperature."""
+        return self._derived.maximum
+        
+    @property
+    def temperature_min(self) -> Optional[float]:
+        """Return session minimum temperature."""
+        return self._derived.minimum
+        
+    @property
+    def fever_duration(self) -> Optional[float]:
+        """Return minutes spent above the fever threshold this session."""
+        return self._derived.fever_minutes
+        
+    def value_updated(self, key: str) -> Optional[datetime]:
+        """Return when the value for key was last decoded, in UTC."""
+        if key == "battery":
+            return self._battery_updated
+        # Производные значения считаются из температуры
+        return self._temperature_updated
+        
     @property
     def last_update(self) -> Optional[datetime]:
         """Return last update time."""
@@ -13,7 +13,23 @@ from homeassistant.components.bluetooth import (
     async_discovered_service_info,
 )
 
-from .const import DOMAIN, CONF_MAC_ADDRESS, CONF_NAME, DEFAULT_DEVICE_NAME, SERVICE_UUID
+from .const import (
+    DOMAIN,
+    CONF_MAC_ADDRESS,
+    CONF_NAME,
+    CONF_FEVER_THRESHOLD,
+    CONF_HIGH_FEVER_THRESHOLD,
+    CONF_ALERT_HYSTERESIS,
+    CONF_ALERT_MIN_DURATION,
+    CONF_SESSION_TIMEOUT,
+    DEFAULT_DEVICE_NAME,
+    DEFAULT_FEVER_THRESHOLD,
+    DEFAULT_HIGH_FEVER_THRESHOLD,
+    DEFAULT_ALERT_HYSTERESIS,
+    DEFAULT_ALERT_MIN_DURATION,
+    DEFAULT_SESSION_TIMEOUT,
+)
+from .t31ble import SERVICE_UUID
 
 class GenialT31ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Genial T31."""
@@ -152,8 +168,19 @@ class GenialT31OptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+        
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            # Высокая температура должна быть выше порога лихорадки
+            if user_input.get(
+                CONF_HIGH_FEVER_THRESHOLD, DEFAULT_HIGH_FEVER_THRESHOLD
+            ) <= user_input.get(CONF_FEVER_THRESHOLD, DEFAULT_FEVER_THRESHOLD):
+                errors[CONF_HIGH_FEVER_THRESHOLD] = "high_fever_below_fever"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+        
+        # При ошибке показываем введенные значения
+        options = {**self.config_entry.options, **(user_input or {})}
         
         return self.async_show_form(
             step_id="init",
@@ -162,5 +189,36 @@ class GenialT31OptionsFlow(config_entries.OptionsFlow):
                     CONF_NAME,
                     default=self.config_entry.data.get(CONF_NAME, DEFAULT_DEVICE_NAME)
                 ): str,
-            })
+                vol.Optional(
+                    CONF_FEVER_THRESHOLD,
+                    default=options.get(
+                        CONF_FEVER_THRESHOLD, DEFAULT_FEVER_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=30.0, max=45.0)),
+                vol.Optional(
+                    CONF_HIGH_FEVER_THRESHOLD,
+                    default=options.get(
+                        CONF_HIGH_FEVER_THRESHOLD, DEFAULT_HIGH_FEVER_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=30.0, max=45.0)),
+                vol.Optional(
+                    CONF_ALERT_HYSTERESIS,
+                    default=options.get(
+                        CONF_ALERT_HYSTERESIS, DEFAULT_ALERT_HYSTERESIS
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=2.0)),
+                vol.Optional(
+                    CONF_ALERT_MIN_DURATION,
+                    default=options.get(
+                        CONF_ALERT_MIN_DURATION, DEFAULT_ALERT_MIN_DURATION
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                vol.Optional(
+                    CONF_SESSION_TIMEOUT,
+                    default=options.get(
+                        CONF_SESSION_TIMEOUT, DEFAULT_SESSION_TIMEOUT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+            }),
+            errors=errors,
         )
@@ -9,22 +9,26 @@ CONF_MAC_ADDRESS = "mac_address"
 DEFAULT_DEVICE_NAME = "Genial T31 Thermometer"
 
 CONF_NAME = "name"
+CONF_FEVER_THRESHOLD = "fever_threshold"
+CONF_HIGH_FEVER_THRESHOLD = "high_fever_threshold"
+CONF_ALERT_HYSTERESIS = "alert_hysteresis"
+CONF_ALERT_MIN_DURATION = "alert_min_duration"
+CONF_SESSION_TIMEOUT = "session_timeout"
+
+DEFAULT_FEVER_THRESHOLD = 37.5  # °C
+DEFAULT_HIGH_FEVER_THRESHOLD = 39.0  # °C
+DEFAULT_ALERT_HYSTERESIS = 0.2  # °C
+DEFAULT_ALERT_MIN_DURATION = 5  # секунд
+DEFAULT_SESSION_TIMEOUT = 30  # минут без данных = новая сессия
+
+# Оповещения
+EVENT_ALERT = f"{DOMAIN}_alert"
+ALERT_FEVER = "fever"
+ALERT_HIGH_FEVER = "high_fever"
 
 # Таймауты
 DATA_TIMEOUT = timedelta(seconds=45)  # 45 секунд без данных = отключение
 RECONNECT_INTERVAL = timedelta(seconds=60)  # Переподключение через 60 сек
 UPDATE_INTERVAL = timedelta(seconds=30)  # Проверка состояния каждые 30 сек
-
-# BLE UUIDs
-SERVICE_UUID = "00001809-0000-1000-8000-00805f9b34fb"
-CHAR_TX_UUID = "0000fff2-0000-1000-8000-00805f9b34fb"
-CHAR_RX_UUID = "0000fff1-0000-1000-8000-00805f9b34fb"
-
-# Initialization packets
-INIT_PACKETS = [
-    bytes([0xA6, 0x02, 0xB1, 0x00, 0xB3, 0x6A]),
-    bytes([0xA6, 0x02, 0xA5, 0x00, 0xA7, 0x6A]),
-    bytes([0xA6, 0x02, 0x1D, 0x00, 0x1F, 0x6A]),
-    bytes([0xA6, 0x05, 0x37, 0x03, 0x0B, 0x06, 0x24, 0x74, 0x6A]),
-    bytes([0xA6, 0x05, 0x37, 0x03, 0x0B, 0x06, 0x25, 0x75, 0x6A]),
-]
+RATE_WINDOW = timedelta(minutes=5)  # Окно для скорости изменения температуры
+RESTORE_MAX_AGE = timedelta(hours=1)  # Старше - не показываем после перезапуска
@@ -1,13 +1,20 @@
 """Data coordinator for Genial T31."""
 import asyncio
 import logging
-from datetime import timedelta
-from typing import Any, Dict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOGGER, UPDATE_INTERVAL, RECONNECT_INTERVAL
+from .const import (
+    DOMAIN,
+    LOGGER,
+    UPDATE_INTERVAL,
+    RECONNECT_INTERVAL,
+    RESTORE_MAX_AGE,
+)
 
 class GenialT31Coordinator(DataUpdateCoordinator):
     """Coordinator for Genial T31 device."""
@@ -24,16 +31,56 @@ class GenialT31Coordinator(DataUpdateCoordinator):
         self.data: Dict[str, Any] = {
             "temperature": None,
             "battery": None,
+            "temperature_rate": None,
+            "temperature_max": None,
+            "temperature_min": None,
+            "fever_duration": None,
             "connected": False,
             "last_data_received": None,
             "data_timeout_seconds": None,
         }
         self._last_connection_attempt = 0
+        # Восстановленные после перезапуска значения и их время
+        self._restored: Dict[str, datetime] = {}
+        # Время измерения каждого значения (UTC)
+        self._measured_at: Dict[str, datetime] = {}
+        
+    @callback
+    def async_restore(self, key: str, value: Any, timestamp: datetime) -> None:
+        """Seed data with a restored value until a live value arrives.
+
+        timestamp must be timezone-aware.
+        """
+        if self.data.get(key) is not None:
+            return
+        if dt_util.utcnow() - timestamp > RESTORE_MAX_AGE:
+            return
+        self.data[key] = value
+        self._restored[key] = timestamp
+        self._measured_at[key] = timestamp
+        
+    def restored_at(self, key: str) -> Optional[datetime]:
+        """Return when a restored value was measured, None if it is live."""
+        return self._restored.get(key)
+        
+    def measured_at(self, key: str) -> Optional[datetime]:
+        """Return when the current value was measured, in UTC."""
+        return self._measured_at.get(key)
+        
+    def _expire_restored(self) -> None:
+        """Drop restored values that are too old to show."""
+        now = dt_util.utcnow()
+        for key, timestamp in list(self._restored.items()):
+            if now - timestamp > RESTORE_MAX_AGE:
+                del self._restored[key]
+                self._measured_at.pop(key, None)
+                self.data[key] = None
         
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update device data."""
         try:
             current_time = asyncio.get_event_loop().time()
+            self._expire_restored()
             
             # Проверяем таймаут данных
             if self.client.check_data_timeout():
@@ -59,9 +106,15 @@ class GenialT31Coordinator(DataUpdateCoordinator):
                     self._last_connection_attempt = current_time
             
             # Обновляем данные
-            self.data.update({
+            self._update_values({
                 "temperature": self.client.temperature,
                 "battery": self.client.battery,
+                "temperature_rate": self.client.temperature_rate,
+                "temperature_max": self.client.temperature_max,
+                "temperature_min": self.client.temperature_min,
+                "fever_duration": self.client.fever_duration,
+            })
+            self.data.update({
                 "connected": self.client.connected,
                 "last_data_received": self.client.last_data_received,
                 "data_timeout_seconds": self.client.data_timeout_seconds,
@@ -72,4 +125,16 @@ class GenialT31Coordinator(DataUpdateCoordinator):
         except Exception as err:
             LOGGER.error("Ошибка обновления: %s", err)
             self.data["connected"] = False
-            return self.data
\ No newline at end of file
+            return self.data
+    
+    def _update_values(self, values: Dict[str, Any]) -> None:
+        """Update values, keeping restored ones until live data replaces them."""
+        for key, value in values.items():
+            if value is None and key in self._restored:
+                continue
+            self._restored.pop(key, None)
+            self.data[key] = value
+            if value is None:
+                self._measured_at.pop(key, None)
+            else:
+                self._measured_at[key] = self.client.value_updated(key)
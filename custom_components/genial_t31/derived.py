@@ -0,0 +1,102 @@
+"""Incremental derived values for Genial T31 readings."""
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+
+class DerivedTemperature:
+    """Rate of change, session extremes and time above the fever threshold.
+
+    Every reading is processed in O(1) (amortized for the rolling window),
+    so nothing has to be recomputed from history.
+    """
+
+    def __init__(
+        self,
+        fever_threshold: float,
+        rate_window: float,
+        session_timeout: float,
+        max_gap: float,
+    ) -> None:
+        """Initialize the tracker.
+
+        rate_window is the rolling window for the rate of change,
+        session_timeout the gap between readings that starts a new session
+        and max_gap the longest interval still counted as fever time, all in
+        seconds.
+        """
+        self.fever_threshold = fever_threshold
+        self._rate_window = rate_window
+        self._session_timeout = session_timeout
+        self._max_gap = max_gap
+        self._window: Deque[Tuple[float, float]] = deque()
+        self._rate: Optional[float] = None
+        self._maximum: Optional[float] = None
+        self._minimum: Optional[float] = None
+        self._fever_seconds = 0.0
+        self._last: Optional[Tuple[float, float]] = None
+
+    def reset(self) -> None:
+        """Start a new measurement session."""
+        self._window.clear()
+        self._rate = None
+        self._maximum = None
+        self._minimum = None
+        self._fever_seconds = 0.0
+        self._last = None
+
+    def add(self, temperature: float, now: float) -> None:
+        """Add a reading taken at monotonic time now (seconds)."""
+        # Сессия переживает переподключения, но не долгий перерыв
+        if self._last is not None and now - self._last[0] > self._session_timeout:
+            self.reset()
+
+        # Время выше порога считаем по интервалу с предыдущего показания,
+        # пропуски в данных не считаем
+        if self._last is not None:
+            last_time, last_temperature = self._last
+            interval = now - last_time
+            if (
+                last_temperature >= self.fever_threshold
+                and 0 < interval <= self._max_gap
+            ):
+                self._fever_seconds += interval
+        self._last = (now, temperature)
+
+        if self._maximum is None or temperature > self._maximum:
+            self._maximum = temperature
+        if self._minimum is None or temperature < self._minimum:
+            self._minimum = temperature
+
+        # Скользящее окно: выбрасываем устаревшие показания
+        window = self._window
+        window.append((now, temperature))
+        while len(window) > 1 and now - window[1][0] >= self._rate_window:
+            window.popleft()
+
+        first_time, first_temperature = window[0]
+        if now > first_time:
+            self._rate = (temperature - first_temperature) / (now - first_time) * 60.0
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Return the rate of change in °C/min over the rolling window."""
+        if self._rate is None:
+            return None
+        return round(self._rate, 3)
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """Return the session maximum temperature."""
+        return self._maximum
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Return the session minimum temperature."""
+        return self._minimum
+
+    @property
+    def fever_minutes(self) -> Optional[float]:
+        """Return the cumulative session time above the fever threshold."""
+        if self._last is None:
+            return None
+        return round(self._fever_seconds / 60.0, 2)
@@ -3,18 +3,22 @@ import logging
 from typing import Optional
 from datetime import datetime
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import RestoreSensor
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, DEFAULT_DEVICE_NAME
 from .coordinator import GenialT31Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Производные значения сессии после перезапуска начинаются заново
+RESTORE_SENSOR_TYPES = {"temperature", "battery"}
+
 SENSOR_TYPES = {
     "temperature": {
         "unit": "°C",
@@ -28,6 +32,30 @@ SENSOR_TYPES = {
         "device_class": "battery",
         "state_class": "measurement",
     },
+    "temperature_rate": {
+        "unit": "°C/min",
+        "icon": "mdi:thermometer-chevron-up",
+        "device_class": None,
+        "state_class": "measurement",
+    },
+    "temperature_max": {
+        "unit": "°C",
+        "icon": "mdi:thermometer-high",
+        "device_class": "temperature",
+        "state_class": "measurement",
+    },
+    "temperature_min": {
+        "unit": "°C",
+        "icon": "mdi:thermometer-low",
+        "device_class": "temperature",
+        "state_class": "measurement",
+    },
+    "fever_duration": {
+        "unit": "min",
+        "icon": "mdi:timer-alert-outline",
+        "device_class": "duration",
+        "state_class": "total_increasing",
+    },
 }
 
 async def async_setup_entry(
@@ -39,14 +67,14 @@ async def async_setup_entry(
     coordinator: GenialT31Coordinator = hass.data[DOMAIN][entry.entry_id]
     
     sensors = [
-        GenialT31Sensor(coordinator, entry, "temperature"),
-        GenialT31Sensor(coordinator, entry, "battery"),
+        GenialT31Sensor(coordinator, entry, sensor_type)
+        for sensor_type in SENSOR_TYPES
     ]
     
     async_add_entities(sensors)
 
 
-class GenialT31Sensor(CoordinatorEntity, SensorEntity):
+class GenialT31Sensor(CoordinatorEntity, RestoreSensor):
     """Representation of a Genial T31 sensor."""
     
     def __init__(
@@ -77,17 +105,46 @@ class GenialT31Sensor(CoordinatorEntity, SensorEntity):
             sw_version="1.0",
         )
         
+    async def async_added_to_hass(self) -> None:
+        """Restore the last value into the coordinator."""
+        await super().async_added_to_hass()
+        
+        if self._sensor_type not in RESTORE_SENSOR_TYPES:
+            return
+        
+        last_state = await self.async_get_last_state()
+        last_data = await self.async_get_last_sensor_data()
+        if last_state is None or last_data is None or last_data.native_value is None:
+            return
+        
+        # Время измерения берем из атрибута, иначе время записи состояния
+        measured_at = None
+        if last_data_received := last_state.attributes.get("last_data_received"):
+            measured_at = dt_util.parse_datetime(last_data_received)
+        if measured_at is None:
+            measured_at = last_state.last_updated
+        elif measured_at.tzinfo is None:
+            # Клиент пишет время ОС без часового пояса
+            measured_at = measured_at.astimezone()
+        measured_at = dt_util.as_utc(measured_at)
+        
+        self.coordinator.async_restore(
+            self._sensor_type, last_data.native_value, measured_at
+        )
+        
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
+        # Восстановленное значение показываем до прихода живых данных
+        if self.coordinator.restored_at(self._sensor_type) is not None:
+            return True
+        
         # Сенсор доступен только если устройство подключено и есть данные
         is_connected = self.coordinator.data.get("connected", False)
         
-        if self._sensor_type == "temperature":
-            return is_connected and self.native_value is not None
-        elif self._sensor_type == "battery":
+        if self._sensor_type == "battery":
             return is_connected
-        return is_connected
+        return is_connected and self.native_value is not None
         
     @property
     def native_value(self) -> Optional[float]:
@@ -104,12 +161,22 @@ class GenialT31Sensor(CoordinatorEntity, SensorEntity):
             attrs["last_update"] = last_update.isoformat()
         
         # Время последних данных
-        if last_data := self.coordinator.data.get("last_data_received"):
+        restored_at = self.coordinator.restored_at(self._sensor_type)
+        if restored_at is not None:
+            attrs["last_data_received"] = restored_at.isoformat()
+        elif last_data := self.coordinator.data.get("last_data_received"):
             if isinstance(last_data, datetime):
                 attrs["last_data_received"] = last_data.isoformat()
             else:
                 attrs["last_data_received"] = str(last_data)
         
+        # Возраст значения считаем по времени его собственного измерения
+        attrs["restored"] = restored_at is not None
+        if measured_at := self.coordinator.measured_at(self._sensor_type):
+            attrs["value_age_seconds"] = round(
+                (dt_util.utcnow() - measured_at).total_seconds(), 1
+            )
+        
         # Таймаут данных
         if timeout := self.coordinator.data.get("data_timeout_seconds"):
             attrs["data_timeout_seconds"] = round(timeout, 1)
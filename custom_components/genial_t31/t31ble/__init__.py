@@ -0,0 +1,40 @@
+"""Genial T31 protocol library without Home Assistant dependencies."""
+from .const import (
+    SERVICE_UUID,
+    CHAR_TX_UUID,
+    CHAR_RX_UUID,
+    INIT_PACKETS,
+)
+from .protocol import (
+    BatteryReading,
+    Reading,
+    TemperatureReading,
+    battery_percent,
+    decode_packet,
+    encode_battery_packet,
+    encode_temperature_packet,
+)
+from .transport import (
+    BleakTransport,
+    SimulatedTransport,
+    send_init_packets,
+    start_measurement,
+)
+
+__all__ = [
+    "SERVICE_UUID",
+    "CHAR_TX_UUID",
+    "CHAR_RX_UUID",
+    "INIT_PACKETS",
+    "BatteryReading",
+    "Reading",
+    "TemperatureReading",
+    "battery_percent",
+    "decode_packet",
+    "encode_battery_packet",
+    "encode_temperature_packet",
+    "BleakTransport",
+    "SimulatedTransport",
+    "send_init_packets",
+    "start_measurement",
+]
@@ -0,0 +1,6 @@
+"""Run the Genial T31 logger: python -m t31ble."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
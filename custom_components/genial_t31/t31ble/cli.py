@@ -0,0 +1,117 @@
+"""Command line logger streaming Genial T31 readings as CSV."""
+import argparse
+import asyncio
+import csv
+import logging
+import sys
+from datetime import datetime
+from typing import List, Optional, TextIO
+
+from .protocol import TemperatureReading, decode_packet
+from .transport import BleakTransport, SimulatedTransport, start_measurement
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _positive_float(value: str) -> float:
+    """Parse a float that must be greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from None
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than zero: {value!r}")
+    return number
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="t31ble",
+        description="Stream decoded Genial T31 readings to stdout or a CSV file.",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("address", nargs="?", help="device MAC address")
+    source.add_argument(
+        "--simulate", action="store_true", help="use a simulated thermometer"
+    )
+    parser.add_argument("--csv", metavar="FILE", help="write to FILE instead of stdout")
+    parser.add_argument(
+        "--duration",
+        type=_positive_float,
+        help="stop after this many seconds, including the handshake",
+    )
+    parser.add_argument(
+        "--rate",
+        type=_positive_float,
+        default=10.0,
+        help="packets per second of the simulated thermometer (default: 10)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace, output: TextIO) -> bool:
+    """Connect and write readings until interrupted or duration elapses.
+
+    Return False if the device disconnected before that.
+    """
+    writer = csv.writer(output)
+    writer.writerow(["timestamp", "type", "value"])
+
+    def handle_packet(data: bytearray) -> None:
+        reading = decode_packet(data)
+        if reading is None:
+            return
+        timestamp = datetime.now().isoformat()
+        if isinstance(reading, TemperatureReading):
+            writer.writerow([timestamp, "temperature", f"{reading.temperature:.2f}"])
+        else:
+            writer.writerow([timestamp, "battery", reading.percent])
+        output.flush()
+
+    disconnected = asyncio.Event()
+    if args.simulate:
+        transport = SimulatedTransport(
+            rate=args.rate, disconnected_callback=disconnected.set
+        )
+    else:
+        transport = await BleakTransport.connect(
+            args.address, disconnected_callback=disconnected.set
+        )
+
+    async def stream() -> None:
+        await start_measurement(transport, handle_packet)
+        await disconnected.wait()
+        _LOGGER.error("Device disconnected")
+
+    try:
+        # Отсчет длительности начинается до инициализации устройства
+        if args.duration is None:
+            await stream()
+        else:
+            try:
+                await asyncio.wait_for(stream(), args.duration)
+            except asyncio.TimeoutError:
+                return True
+        return False
+    finally:
+        if transport.is_connected:
+            await transport.stop_notify()
+            await transport.disconnect()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the logger."""
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    output = open(args.csv, "w", newline="") if args.csv else sys.stdout
+    try:
+        completed = asyncio.run(_run(args, output))
+    except KeyboardInterrupt:
+        completed = True
+    finally:
+        if args.csv:
+            output.close()
+    return 0 if completed else 1
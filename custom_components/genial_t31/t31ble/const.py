@@ -0,0 +1,31 @@
+"""Genial T31 protocol constants."""
+
+# BLE UUIDs
+SERVICE_UUID = "00001809-0000-1000-8000-00805f9b34fb"
+CHAR_TX_UUID = "0000fff2-0000-1000-8000-00805f9b34fb"
+CHAR_RX_UUID = "0000fff1-0000-1000-8000-00805f9b34fb"
+
+# Initialization packets
+INIT_PACKETS = [
+    bytes([0xA6, 0x02, 0xB1, 0x00, 0xB3, 0x6A]),
+    bytes([0xA6, 0x02, 0xA5, 0x00, 0xA7, 0x6A]),
+    bytes([0xA6, 0x02, 0x1D, 0x00, 0x1F, 0x6A]),
+    bytes([0xA6, 0x05, 0x37, 0x03, 0x0B, 0x06, 0x24, 0x74, 0x6A]),
+    bytes([0xA6, 0x05, 0x37, 0x03, 0x0B, 0x06, 0x25, 0x75, 0x6A]),
+]
+
+# Пауза перед инициализацией и между пакетами, секунд
+INIT_DELAY = 0.5
+INIT_PACKET_INTERVAL = 1.0
+
+# Пакеты уведомлений
+TEMPERATURE_PACKET_LENGTH = 13
+BATTERY_PACKET_LENGTH = 9
+
+# Допустимый диапазон температуры, °C
+MIN_TEMPERATURE = 20.0
+MAX_TEMPERATURE = 45.0
+
+# Напряжение батареи для 0% и 100%, В
+MIN_BATTERY_VOLTAGE = 2.0
+MAX_BATTERY_VOLTAGE = 2.45
@@ -0,0 +1,73 @@
+"""Genial T31 packet decoding and encoding."""
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from .const import (
+    TEMPERATURE_PACKET_LENGTH,
+    BATTERY_PACKET_LENGTH,
+    MIN_TEMPERATURE,
+    MAX_TEMPERATURE,
+    MIN_BATTERY_VOLTAGE,
+    MAX_BATTERY_VOLTAGE,
+)
+
+
+@dataclass(frozen=True)
+class TemperatureReading:
+    """Temperature reported by the thermometer."""
+
+    temperature: float
+
+
+@dataclass(frozen=True)
+class BatteryReading:
+    """Battery state reported by the thermometer."""
+
+    voltage: float
+    percent: int
+
+
+Reading = Union[TemperatureReading, BatteryReading]
+
+
+def battery_percent(voltage: float) -> int:
+    """Convert battery voltage to a 0-100 percentage."""
+    percent = (
+        (voltage - MIN_BATTERY_VOLTAGE)
+        / (MAX_BATTERY_VOLTAGE - MIN_BATTERY_VOLTAGE)
+        * 100.0
+    )
+    return int(max(0, min(100, percent)))
+
+
+def decode_packet(data: bytes) -> Optional[Reading]:
+    """Decode a notification packet, None if it carries no reading."""
+    if len(data) == TEMPERATURE_PACKET_LENGTH:
+        temperature = ((data[3] << 8) | data[4]) / 100.0
+        if MIN_TEMPERATURE <= temperature <= MAX_TEMPERATURE:
+            return TemperatureReading(temperature)
+        return None
+
+    if len(data) == BATTERY_PACKET_LENGTH:
+        voltage = ((data[5] << 8) | data[6]) / 100.0
+        return BatteryReading(voltage, battery_percent(voltage))
+
+    return None
+
+
+def encode_temperature_packet(temperature: float) -> bytes:
+    """Build a temperature packet as accepted by decode_packet."""
+    raw = round(temperature * 100)
+    packet = bytearray(TEMPERATURE_PACKET_LENGTH)
+    packet[3] = (raw >> 8) & 0xFF
+    packet[4] = raw & 0xFF
+    return bytes(packet)
+
+
+def encode_battery_packet(voltage: float) -> bytes:
+    """Build a battery packet as accepted by decode_packet."""
+    raw = round(voltage * 100)
+    packet = bytearray(BATTERY_PACKET_LENGTH)
+    packet[5] = (raw >> 8) & 0xFF
+    packet[6] = raw & 0xFF
+    return bytes(packet)
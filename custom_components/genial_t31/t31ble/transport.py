@@ -0,0 +1,161 @@
+"""Transports for talking to a Genial T31."""
+import asyncio
+import logging
+import math
+import random
+import time
+from typing import Callable, List, Optional
+
+from .const import (
+    CHAR_TX_UUID,
+    CHAR_RX_UUID,
+    INIT_PACKETS,
+    INIT_DELAY,
+    INIT_PACKET_INTERVAL,
+)
+from .protocol import encode_temperature_packet, encode_battery_packet
+
+_LOGGER = logging.getLogger(__name__)
+
+NotifyCallback = Callable[[bytearray], None]
+DisconnectedCallback = Callable[[], None]
+
+
+class BleakTransport:
+    """Transport over a connected bleak client."""
+
+    def __init__(self, client) -> None:
+        """Initialize the transport with a connected BleakClient."""
+        self.client = client
+
+    @classmethod
+    async def connect(
+        cls,
+        address: str,
+        timeout: float = 20.0,
+        disconnected_callback: Optional[DisconnectedCallback] = None,
+    ) -> "BleakTransport":
+        """Connect to the device directly with bleak."""
+        # bleak импортируем только здесь, чтобы пакет загружался быстро
+        from bleak import BleakClient
+
+        def handle_disconnect(_client) -> None:
+            if disconnected_callback:
+                disconnected_callback()
+
+        client = BleakClient(
+            address, disconnected_callback=handle_disconnect, timeout=timeout
+        )
+        await client.connect()
+        return cls(client)
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True if the client is connected."""
+        return self.client.is_connected
+
+    async def start_notify(self, callback: NotifyCallback) -> None:
+        """Subscribe to notifications."""
+        await self.client.start_notify(
+            CHAR_RX_UUID, lambda _sender, data: callback(data)
+        )
+
+    async def stop_notify(self) -> None:
+        """Unsubscribe from notifications."""
+        await self.client.stop_notify(CHAR_RX_UUID)
+
+    async def write(self, data: bytes) -> None:
+        """Write a packet to the device."""
+        await self.client.write_gatt_char(CHAR_TX_UUID, data)
+
+    async def disconnect(self) -> None:
+        """Disconnect from the device."""
+        await self.client.disconnect()
+
+
+class SimulatedTransport:
+    """Transport that emits synthetic packets, for bench testing."""
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        start_temperature: float = 34.0,
+        target_temperature: float = 36.8,
+        battery_voltage: float = 2.4,
+        disconnected_callback: Optional[DisconnectedCallback] = None,
+        disconnect_after: Optional[float] = None,
+    ) -> None:
+        """Initialize the transport; rate is temperature packets per second.
+
+        disconnect_after simulates the device dropping the connection after
+        that many seconds of streaming.
+        """
+        self._interval = 1.0 / rate
+        self._disconnected_callback = disconnected_callback
+        self._disconnect_after = disconnect_after
+        self._start_temperature = start_temperature
+        self._target_temperature = target_temperature
+        self._battery_voltage = battery_voltage
+        self._task: Optional[asyncio.Task] = None
+        self.written: List[bytes] = []
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True while packets are being emitted."""
+        return self._task is not None and not self._task.done()
+
+    async def start_notify(self, callback: NotifyCallback) -> None:
+        """Start emitting packets."""
+        self._task = asyncio.create_task(self._emit(callback))
+
+    async def stop_notify(self) -> None:
+        """Stop emitting packets."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def write(self, data: bytes) -> None:
+        """Record a packet written to the device."""
+        self.written.append(bytes(data))
+
+    async def disconnect(self) -> None:
+        """Disconnect from the simulated device."""
+        await self.stop_notify()
+
+    async def _emit(self, callback: NotifyCallback) -> None:
+        """Emit a warming-up curve like a thermometer put under the arm."""
+        started = time.monotonic()
+        callback(bytearray(encode_battery_packet(self._battery_voltage)))
+        while True:
+            elapsed = time.monotonic() - started
+            if self._disconnect_after is not None and elapsed >= self._disconnect_after:
+                if self._disconnected_callback:
+                    self._disconnected_callback()
+                return
+            temperature = self._target_temperature - (
+                self._target_temperature - self._start_temperature
+            ) * math.exp(-elapsed / 60.0)
+            temperature += random.uniform(-0.02, 0.02)
+            callback(bytearray(encode_temperature_packet(temperature)))
+            await asyncio.sleep(self._interval)
+
+
+async def send_init_packets(transport, interval: float = INIT_PACKET_INTERVAL) -> None:
+    """Send initialization packets, logging and skipping failed ones."""
+    for i, packet in enumerate(INIT_PACKETS, 1):
+        try:
+            await transport.write(packet)
+            await asyncio.sleep(interval)
+        except Exception as err:
+            _LOGGER.error("Ошибка отправки пакета %d: %s", i, err)
+
+
+async def start_measurement(transport, callback: NotifyCallback) -> None:
+    """Enable notifications and start the measurement stream."""
+    await transport.start_notify(callback)
+    await asyncio.sleep(INIT_DELAY)
+    await send_init_packets(transport)
@@ -0,0 +1,6 @@
+"""Make the Home Assistant-independent modules importable without HA."""
+import sys
+from pathlib import Path
+
+# Пакет интеграции не импортируем: его __init__ тянет Home Assistant
+sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "genial_t31"))
@@ -0,0 +1,83 @@
+"""Tests for the threshold alert engine."""
+import pytest
+
+from alerts import AlertEngine
+
+
+def _engine() -> AlertEngine:
+    return AlertEngine({"fever": 37.5, "high_fever": 39.0}, 0.2, 5.0, 45.0)
+
+
+def _feed(engine: AlertEngine, readings, start: float = 0.0):
+    """Feed one reading per second, return transitions with their time."""
+    result = []
+    for i, temperature in enumerate(readings):
+        now = start + i
+        result.extend((now, alert, active) for alert, active in engine.process(temperature, now))
+    return result
+
+
+def test_on_after_min_duration() -> None:
+    engine = _engine()
+    transitions = _feed(engine, [37.0] + [37.6] * 7)
+    assert transitions == [(6.0, "fever", True)]
+    assert engine.is_active("fever")
+    assert not engine.is_active("high_fever")
+
+
+def test_zero_min_duration_fires_immediately() -> None:
+    engine = AlertEngine({"fever": 37.5}, 0.2, 0.0, 45.0)
+    assert engine.process(37.5, 0.0) == [("fever", True)]
+
+
+def test_off_only_below_threshold_minus_hysteresis() -> None:
+    engine = _engine()
+    _feed(engine, [37.6] * 6)
+    assert engine.is_active("fever")
+
+    # В полосе гистерезиса оповещение держится
+    assert _feed(engine, [37.4] * 10, start=6.0) == []
+    assert engine.is_active("fever")
+
+    transitions = _feed(engine, [37.2] * 6, start=16.0)
+    assert transitions == [(21.0, "fever", False)]
+    assert not engine.is_active("fever")
+
+
+def test_pending_resets_when_reading_falls_back() -> None:
+    engine = _engine()
+    # Пересечение прерывается на 4-й секунде и начинается заново
+    transitions = _feed(engine, [37.6, 37.6, 37.6, 37.6, 37.0] + [37.6] * 6)
+    assert transitions == [(10.0, "fever", True)]
+
+
+@pytest.mark.parametrize(
+    ("min_duration", "interval"),
+    [(5.0, 5.5), (5.0, 6.0), (1.0, 1.05), (5.0, 30.0)],
+)
+def test_readings_sparser_than_min_duration_still_activate(
+    min_duration: float, interval: float
+) -> None:
+    engine = AlertEngine({"fever": 37.5}, 0.2, min_duration, 45.0)
+    transitions = [
+        (i, transition)
+        for i in range(10)
+        for transition in engine.process(38.5, i * interval)
+    ]
+    assert transitions == [(1, ("fever", True))]
+
+
+def test_gap_between_readings_restarts_pending() -> None:
+    engine = _engine()
+    engine.process(37.6, 0.0)
+    # Разрыв связи: первое показание после него не подтверждает пересечение
+    assert engine.process(37.6, 300.0) == []
+    assert _feed(engine, [37.6] * 5, start=301.0) == [(305.0, "fever", True)]
+
+
+def test_reset_pending() -> None:
+    engine = _engine()
+    _feed(engine, [37.6] * 4)
+    engine.reset_pending()
+    assert engine.process(37.6, 4.0) == []
+    assert not engine.is_active("fever")
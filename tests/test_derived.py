@@ -0,0 +1,83 @@
+"""Tests for incremental derived temperature values."""
+import pytest
+
+from derived import DerivedTemperature
+
+
+def _tracker(session_timeout: float = 1800.0) -> DerivedTemperature:
+    return DerivedTemperature(37.5, 300.0, session_timeout, 45.0)
+
+
+def test_empty() -> None:
+    tracker = _tracker()
+    assert tracker.rate is None
+    assert tracker.maximum is None
+    assert tracker.minimum is None
+    assert tracker.fever_minutes is None
+
+
+def test_rate_units_and_sign() -> None:
+    tracker = _tracker()
+    tracker.add(36.0, 0.0)
+    assert tracker.rate is None
+    tracker.add(36.5, 60.0)
+    assert tracker.rate == pytest.approx(0.5)
+    tracker.add(35.5, 120.0)
+    assert tracker.rate == pytest.approx(-0.25)
+
+
+def test_rate_window_eviction() -> None:
+    tracker = _tracker()
+    # Старое показание 30.0 должно выпасть из 5-минутного окна
+    tracker.add(30.0, 0.0)
+    for minute in range(1, 12):
+        tracker.add(36.0 + minute * 0.1, minute * 60.0)
+    # Окно начинается с показания ровно 5 минут назад: 36.6 -> 37.1
+    assert tracker.rate == pytest.approx(0.1)
+
+
+def test_min_max() -> None:
+    tracker = _tracker()
+    for i, temperature in enumerate([36.6, 38.2, 35.9, 37.0]):
+        tracker.add(temperature, i * 10.0)
+    assert tracker.maximum == 38.2
+    assert tracker.minimum == 35.9
+
+
+def test_fever_time_counts_intervals_starting_above_threshold() -> None:
+    tracker = _tracker()
+    tracker.add(37.0, 0.0)  # ниже порога: 0..30 не считается
+    tracker.add(37.5, 30.0)  # ровно порог: 30..60 считается
+    tracker.add(38.0, 60.0)  # 60..90 считается
+    tracker.add(37.4, 90.0)  # ниже порога: 90..120 не считается
+    tracker.add(37.2, 120.0)
+    assert tracker.fever_minutes == pytest.approx(1.0)
+
+
+def test_session_survives_short_gap_without_counting_it() -> None:
+    tracker = _tracker()
+    tracker.add(38.0, 0.0)
+    tracker.add(38.5, 30.0)
+    # Пропуск в данных длиннее max_gap не считается временем выше порога
+    tracker.add(37.0, 600.0)
+    assert tracker.maximum == 38.5
+    assert tracker.minimum == 37.0
+    assert tracker.fever_minutes == pytest.approx(0.5)
+
+
+def test_fever_time_counts_interval_up_to_max_gap() -> None:
+    tracker = _tracker()
+    tracker.add(38.0, 0.0)
+    tracker.add(38.0, 45.0)
+    assert tracker.fever_minutes == pytest.approx(0.75)
+
+
+def test_session_resets_after_timeout() -> None:
+    tracker = _tracker(session_timeout=1800.0)
+    tracker.add(38.0, 0.0)
+    tracker.add(38.5, 60.0)
+    tracker.add(36.6, 60.0 + 1801.0)
+    assert tracker.maximum == 36.6
+    assert tracker.minimum == 36.6
+    assert tracker.fever_minutes == 0.0
+    assert tracker.rate is None
@@ -0,0 +1,116 @@
+"""Tests for the Home Assistant-independent T31 protocol package."""
+import asyncio
+import csv
+import functools
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from t31ble import (
+    INIT_PACKETS,
+    BatteryReading,
+    SimulatedTransport,
+    TemperatureReading,
+    battery_percent,
+    decode_packet,
+    encode_battery_packet,
+    encode_temperature_packet,
+    send_init_packets,
+)
+from t31ble import cli
+from t31ble.cli import main
+
+
+def test_import_without_home_assistant() -> None:
+    package_dir = Path(__file__).parent.parent / "custom_components" / "genial_t31"
+    code = (
+        "import sys, t31ble, t31ble.cli; "
+        "assert not [m for m in sys.modules if m.startswith(('homeassistant', 'bleak'))]"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=package_dir, check=True)
+
+
+def test_decode_temperature_packet() -> None:
+    packet = bytes([0xA6, 0x0B, 0x00, 0x0E, 0x74, 0, 0, 0, 0, 0, 0, 0, 0x6A])
+    assert decode_packet(packet) == TemperatureReading(37.0)
+
+
+def test_decode_rejects_out_of_range_temperature() -> None:
+    assert decode_packet(encode_temperature_packet(19.99)) is None
+    assert decode_packet(encode_temperature_packet(45.01)) is None
+    assert decode_packet(encode_temperature_packet(20.0)) == TemperatureReading(20.0)
+
+
+def test_decode_battery_packet() -> None:
+    packet = bytes([0, 0, 0, 0, 0, 0x00, 0xEB, 0, 0])
+    assert decode_packet(packet) == BatteryReading(2.35, 77)
+
+
+def test_decode_unknown_packet() -> None:
+    assert decode_packet(b"") is None
+    assert decode_packet(bytes(6)) is None
+
+
+@pytest.mark.parametrize(
+    ("voltage", "percent"),
+    [(1.5, 0), (2.0, 0), (2.225, 50), (2.45, 100), (3.0, 100)],
+)
+def test_battery_percent(voltage: float, percent: int) -> None:
+    assert battery_percent(voltage) == percent
+
+
+@pytest.mark.parametrize("temperature", [20.0, 36.6, 37.55, 41.23, 45.0])
+def test_temperature_round_trip(temperature: float) -> None:
+    reading = decode_packet(encode_temperature_packet(temperature))
+    assert reading == TemperatureReading(temperature)
+
+
+@pytest.mark.parametrize("voltage", [2.0, 2.31, 2.45])
+def test_battery_round_trip(voltage: float) -> None:
+    reading = decode_packet(encode_battery_packet(voltage))
+    assert reading == BatteryReading(voltage, battery_percent(voltage))
+
+
+def test_send_init_packets() -> None:
+    transport = SimulatedTransport()
+    asyncio.run(send_init_packets(transport, interval=0))
+    assert transport.written == INIT_PACKETS
+
+
+def test_cli_simulated_csv(tmp_path: Path) -> None:
+    output = tmp_path / "readings.csv"
+    assert main(["--simulate", "--rate", "50", "--duration", "0.3", "--csv", str(output)]) == 0
+
+    with output.open(newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["timestamp", "type", "value"]
+    assert rows[1][1:] == ["battery", "88"]
+    temperatures = [float(row[2]) for row in rows[2:]]
+    assert len(temperatures) >= 5
+    assert all(row[1] == "temperature" for row in rows[2:])
+    assert all(33.9 <= t <= 37.0 for t in temperatures)
+
+
+@pytest.mark.parametrize("rate", ["0", "-1", "abc"])
+def test_cli_rejects_invalid_rate(rate: str) -> None:
+    with pytest.raises(SystemExit):
+        main(["--simulate", "--rate", rate])
+
+
+def test_cli_returns_error_when_device_disconnects(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def fast_start_measurement(transport, callback) -> None:
+        await transport.start_notify(callback)
+        await send_init_packets(transport, interval=0)
+
+    monkeypatch.setattr(
+        cli, "SimulatedTransport", functools.partial(SimulatedTransport, disconnect_after=0.2)
+    )
+    monkeypatch.setattr(cli, "start_measurement", fast_start_measurement)
+    output = tmp_path / "readings.csv"
+
+    assert main(["--simulate", "--rate", "50", "--duration", "10", "--csv", str(output)]) == 1
+    assert main(["--simulate", "--rate", "50", "--csv", str(output)]) == 1